@@ -16,11 +16,13 @@ INSTRUCTIONS:
 """
 
 import json
+import math
 import re
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, NamedTuple, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 import random
 
 # ============================================
@@ -129,6 +131,63 @@ class BaseBuyerAgent(ABC):
 # PART 3: YOUR IMPLEMENTATION STARTS HERE
 # ============================================
 
+# Price extraction: a rupee-prefixed amount wins over any bare 5+ digit number,
+# so the two patterns stay separate rather than one leftmost-match alternation
+_PRICE_RE_RUPEE = re.compile(r"₹\s*([\d,]+)")
+_PRICE_RE_BIG = re.compile(r"(\d{5,})")
+
+# Non-price reciprocity demands, escalating with the number of concessions made
+_BUYER_DEMANDS = (
+    "free delivery",
+    "extended warranty (6 months)",
+    "priority dispatch",
+    "a small bulk discount on the next order",
+    "payment terms (30 days)",
+)
+_SELLER_DEMANDS = (
+    "commitment to higher volume",
+    "faster payment terms",
+    "exclusive supplier status",
+    "priority contract renewal",
+    "multi-order agreement",
+)
+_BUYER_DEMANDS_LAST = len(_BUYER_DEMANDS) - 1
+_SELLER_DEMANDS_LAST = len(_SELLER_DEMANDS) - 1
+
+# Fair-price multiplier on market price per quality grade
+_GRADE_FAIR_MULT = {"EXPORT": 1.02, "A": 0.98, "B": 0.92}
+
+# 64-bit LCG (Knuth MMIX constants) behind the agents' message-variant choice
+_LCG_MULT = 6364136223846793005
+_LCG_INC = 1442695040888963407
+_LCG_MASK = (1 << 64) - 1
+
+# Outcomes of YourBuyerAgent._compute_counter; each one maps to a reply message
+_OUT_ACCEPT_THRESHOLD = 0
+_OUT_ACCEPT_MARKET_FLOOR = 1
+_OUT_ACCEPT_FINAL = 2
+_OUT_FINAL_OFFER = 3
+_OUT_ACCEPT_TARGET = 4
+_OUT_COUNTER_NO_PRICE = 5
+_OUT_COUNTER = 6
+
+class _BuyerPricing(NamedTuple):
+    """Per-negotiation constants derived from (market price, budget) for YourBuyerAgent"""
+    budget: int
+    opening: int
+    walkaway: int
+    interview_threshold: int
+    market_floor_proxy: int
+    base_far: int
+    base_close: int
+
+def _compose_messages(wrappers: Tuple[str, ...], bodies: Dict[str, str]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Precompose every wrapper ("lead %s tail") around every message body, keyed like bodies.
+    The result is one %-template per (message, wrapper), so a reply needs a single format.
+    """
+    return {key: tuple(w.replace("%s", body) for w in wrappers) for key, body in bodies.items()}
+
 class YourBuyerAgent(BaseBuyerAgent):
     """
     Professional Strategist (Enhanced)
@@ -144,6 +203,19 @@ class YourBuyerAgent(BaseBuyerAgent):
     - Never exceed budget
     """
 
+    __slots__ = (
+        "_last_seller_price", "_min_seller_seen", "_seller_min_est", "_last_my_offer",
+        "_buyer_concessions", "_seller_concessions", "_last_seller_tone", "_pricing_key",
+        "_pricing", "_rng_state",
+    )
+
+    def __init__(self, name: str, seed: Optional[int] = None):
+        super().__init__(name)
+        # state lives for the agent's lifetime, created once up front
+        self._init_state()
+        # message-variant PRNG; drawn from `random` unless a fixed seed is given for replays
+        self._rng_state = (random.getrandbits(64) if seed is None else seed) & _LCG_MASK
+
     # ---- Tunable hyperparameters (deterministic) ----
     MIN_STEP = 1000
     AGG_OPEN_BUDGET_RATIO = 0.78
@@ -155,6 +227,27 @@ class YourBuyerAgent(BaseBuyerAgent):
     MIN_SELLER_MARGIN = 1.10
     SAVINGS_THRESHOLD = 0.10
 
+    # ---- Message wrappers: every lead x tail pairing, "%s" is the content ----
+    _PROFESSIONAL_TEMPLATES = tuple(
+        f"{lead} %s {tail}"
+        for lead in ("For clarity:", "Let's be direct:", "To be efficient:", "Straightforwardly:")
+        for tail in ("Please confirm.", "I expect a prompt response.", "Proceed accordingly.", "This suits my thresholds.")
+    )
+    _MESSAGES = _compose_messages(_PROFESSIONAL_TEMPLATES, {
+        "opening": "My opening is ₹%s for %s units of %s-grade %s.",
+        "accept_threshold": "I accept ₹%s. It meets my efficiency threshold.",
+        "accept_market_floor": "I accept ₹%s. This aligns with my market-floor analysis.",
+        "accept_final": "Finalizing at ₹%s.",
+        "final_offer": "Final offer ₹%s. In return I require: %s. Immediate confirmation concludes the deal.",
+        "accept_target": "Agreed at ₹%s. Efficient resolution.",
+        "counter_no_price": "My counter is ₹%s. Provide a numeric offer to proceed.",
+        "counter_logical": "My counter is ₹%s. This reflects market structure, my ceiling, and time-to-agreement.%s",
+        "counter_appeal": (
+            "My counter is ₹%s. I prefer to work with you — if you can include %s, we can close today."
+            " Let's make this a lasting cooperation."
+        ),
+    })
+
     def define_personality(self) -> Dict[str, Any]:
         return {
             "personality_type": "professional_strategist",
@@ -171,22 +264,29 @@ class YourBuyerAgent(BaseBuyerAgent):
         }
 
     # ---------- State helpers ----------
-    def _init_state(self, context: NegotiationContext):
-        if not hasattr(self, "_state"):
-            self._state = {
-                "seller_history": [],
-                "min_seller_seen": None,
-                "seller_min_est": None,
-                # concession tracking
-                "concessions": {"buyer": [], "seller": []},
-                # last observed tone
-                "last_seller_tone": "neutral",
-            }
-
-    def _format_professional(self, content: str) -> str:
-        lead = random.choice(["For clarity:", "Let's be direct:", "To be efficient:", "Straightforwardly:"])
-        tail = random.choice(["Please confirm.", "I expect a prompt response.", "Proceed accordingly.", "This suits my thresholds."])
-        return f"{lead} {content} {tail}"
+    def _init_state(self):
+        self._last_seller_price: Optional[int] = None
+        self._min_seller_seen: Optional[int] = None
+        self._seller_min_est: Optional[int] = None
+        # our latest offer in the current negotiation (set by the opening)
+        self._last_my_offer: Optional[int] = None
+        # concession tracking
+        self._buyer_concessions: List[int] = []
+        self._seller_concessions: List[int] = []
+        # last observed tone
+        self._last_seller_tone = "neutral"
+        # _BuyerPricing for the (market price, budget) it was derived from; one negotiation needs one
+        self._pricing_key: Optional[Tuple[int, int]] = None
+        self._pricing: Optional[_BuyerPricing] = None
+
+    def _pick(self, seq):
+        """Cheap 64-bit LCG choice; only used to vary message wording"""
+        self._rng_state = s = (self._rng_state * _LCG_MULT + _LCG_INC) & _LCG_MASK
+        return seq[(s >> 33) % len(seq)]
+
+    def _professional_message(self, key: str, *args) -> str:
+        """Format message `key` with args inside a randomly chosen professional wrapper"""
+        return self._pick(self._MESSAGES[key]) % args
 
     # ---------- Emotion / Tone analysis ----------
     def analyze_seller_tone(self, text: str) -> str:
@@ -218,7 +318,7 @@ class YourBuyerAgent(BaseBuyerAgent):
 
     def personality_adaptation(self, seller_message: str) -> str:
         tone = self.analyze_seller_tone(seller_message)
-        self._state["last_seller_tone"] = tone
+        self._last_seller_tone = tone
         # Rule: emotional -> stay logical; logical -> use slight appeal
         if tone == "emotional":
             return "logical"
@@ -228,43 +328,33 @@ class YourBuyerAgent(BaseBuyerAgent):
 
     # ---------- Concession tracking & reciprocity ----------
     def _record_concession(self, actor: str, amount: int):
-        st = self._state
-        st["concessions"][actor].append(amount)
+        concessions = self._buyer_concessions if actor == "buyer" else self._seller_concessions
+        concessions.append(amount)
 
     def _seller_made_concession(self, new_seller_price: int) -> Optional[int]:
         """Detect if seller reduced price compared to last seen; return concession magnitude"""
-        st = self._state
-        hist = st["seller_history"]
-        if not hist:
+        last = self._last_seller_price
+        if last is None:
             return None
-        last = hist[-1]
         if new_seller_price < last:
             return last - new_seller_price
         return None
 
     def _format_reciprocity_request(self, buyer_concession_count: int) -> str:
         """Return a suitable non-price demand depending on how many times buyer has conceded"""
-        demands = [
-            "free delivery",
-            "extended warranty (6 months)",
-            "priority dispatch",
-            "a small bulk discount on the next order",
-            "payment terms (30 days)"
-        ]
-        idx = min(len(demands) - 1, buyer_concession_count - 1) if buyer_concession_count > 0 else 0
-        return demands[idx]
+        return _BUYER_DEMANDS[min(_BUYER_DEMANDS_LAST, max(0, buyer_concession_count - 1))]
 
     # ---------- Pricing helpers (same logic as original) ----------
     def _extract_price(self, text: str) -> Optional[int]:
         if not text:
             return None
-        m = re.search(r"₹\s*([\d,]+)", text)
+        m = _PRICE_RE_RUPEE.search(text)
         if m:
             try:
                 return int(m.group(1).replace(",", ""))
             except:
                 return None
-        m2 = re.search(r"(\d{5,})", text)
+        m2 = _PRICE_RE_BIG.search(text)
         if m2:
             try:
                 return int(m2.group(1))
@@ -272,118 +362,103 @@ class YourBuyerAgent(BaseBuyerAgent):
                 return None
         return None
 
-    def _opening_offer_number(self, context: NegotiationContext) -> int:
-        market = context.product.base_market_price
-        budget = context.your_budget
-        opening = min(int(budget * self.AGG_OPEN_BUDGET_RATIO), int(market * self.MARKET_OPEN_RATIO))
-        return max(self.MIN_STEP, min(opening, budget))
+    @classmethod
+    def _opening_offer_number(cls, market: int, budget: int) -> int:
+        opening = min(int(budget * cls.AGG_OPEN_BUDGET_RATIO), int(market * cls.MARKET_OPEN_RATIO))
+        return max(cls.MIN_STEP, min(opening, budget))
 
-    def _walkaway_cap(self, context: NegotiationContext) -> int:
-        market = context.product.base_market_price
-        return min(int(market * self.WALKAWAY_MARKET_RATIO), context.your_budget)
+    @classmethod
+    def _walkaway_cap(cls, market: int, budget: int) -> int:
+        return min(int(market * cls.WALKAWAY_MARKET_RATIO), budget)
 
     def _update_seller_estimates(self, seller_price: int):
-        st = self._state
-        st["seller_history"].append(seller_price)
+        self._last_seller_price = seller_price
 
-        if st["min_seller_seen"] is None:
-            st["min_seller_seen"] = seller_price
+        if self._min_seller_seen is None:
+            self._min_seller_seen = seller_price
         else:
-            st["min_seller_seen"] = min(st["min_seller_seen"], seller_price)
+            self._min_seller_seen = min(self._min_seller_seen, seller_price)
 
         rough_floor = int(seller_price * 0.85)
-        if st["seller_min_est"] is None:
-            st["seller_min_est"] = rough_floor
+        if self._seller_min_est is None:
+            self._seller_min_est = rough_floor
         else:
-            st["seller_min_est"] = int(self.EST_DECAY * st["seller_min_est"] + (1 - self.EST_DECAY) * rough_floor)
+            self._seller_min_est = int(self.EST_DECAY * self._seller_min_est + (1 - self.EST_DECAY) * rough_floor)
 
     def _closing_target_from_estimate(self, context: NegotiationContext) -> Optional[int]:
-        st = self._state
-        if not st["min_seller_seen"]:
+        if not self._min_seller_seen:
             return None
-        est_min_floor = int(st["min_seller_seen"] * 0.98)
+        est_min_floor = int(self._min_seller_seen * 0.98)
         target = int(est_min_floor * self.MIN_SELLER_MARGIN)
         return max(self.MIN_STEP, target)
 
-    # ---------- Required  ----------
-    def generate_opening_offer(self, context: NegotiationContext) -> Tuple[int, str]:
-        self._init_state(context)
-        offer = self._opening_offer_number(context)
-        name = context.product.name
-        qty = context.product.quantity
-        content = f"My opening is ₹{offer} for {qty} units of {context.product.quality_grade}-grade {name}."
-        # Track initial buyer offer as a 'concession' step 0 (we note but don't demand yet)
-        self._record_concession("buyer", offer)
-        return offer, self._format_professional(content)
-
-    def respond_to_seller_offer(self, context: NegotiationContext, seller_price: int, seller_message: str) -> Tuple[DealStatus, int, str]:
-        self._init_state(context)
-        # Analyze tone and update estimates
-        observed = seller_price if seller_price is not None else self._extract_price(seller_message)
-        if observed:
-            # detect seller concession relative to last seen
-            seller_conc = self._seller_made_concession(observed) if self._state["seller_history"] else None
-            self._update_seller_estimates(observed)
-            if seller_conc and seller_conc > 0:
-                self._record_concession("seller", seller_conc)
-
-        tone_adapt = self.personality_adaptation(seller_message)
-
-        market = context.product.base_market_price
-        budget = context.your_budget
-        opening = self._opening_offer_number(context)
-        walkaway = self._walkaway_cap(context)
-        last_my = context.your_offers[-1] if context.your_offers else opening
+    @classmethod
+    def _derive_pricing(cls, market: int, budget: int) -> _BuyerPricing:
+        return _BuyerPricing(
+            budget=budget,
+            opening=cls._opening_offer_number(market, budget),
+            walkaway=cls._walkaway_cap(market, budget),
+            interview_threshold=int(budget * (1 - cls.SAVINGS_THRESHOLD)),
+            market_floor_proxy=int(market * 0.82),
+            base_far=int(max(cls.MIN_STEP, market * 0.06)),
+            base_close=int(max(cls.MIN_STEP, market * 0.02)),
+        )
 
-        interview_threshold = int(budget * (1 - self.SAVINGS_THRESHOLD))
-        market_floor_proxy = int(market * 0.82)
+    def _pricing_for(self, context: NegotiationContext) -> _BuyerPricing:
+        """Constants that only depend on market price and budget, recomputed when the pair changes"""
+        key = (context.product.base_market_price, context.your_budget)
+        if key != self._pricing_key:
+            self._pricing_key = key
+            self._pricing = self._derive_pricing(*key)
+        return self._pricing
+
+    @classmethod
+    def _compute_counter(cls, c: _BuyerPricing, last_my: int, seller_price: Optional[int],
+                         current_round: int, closing_target: Optional[int]) -> Tuple[int, int]:
+        """
+        Numeric core of respond_to_seller_offer: returns (outcome, price).
+        c holds the pricing constants; seller_price and closing_target may be None (no price
+        seen / no estimate yet). outcome is one of the _OUT_* codes; price is the seller price
+        to accept or our proposal. Reads only class-level tuning, never instance state.
+        """
+        budget, opening, walkaway = c.budget, c.opening, c.walkaway
+        interview_threshold = c.interview_threshold
+        market_floor_proxy = c.market_floor_proxy
 
         # Immediate acceptance conditions (same as before)
         if seller_price is not None:
             if seller_price <= min(interview_threshold, walkaway):
-                msg = f"I accept ₹{seller_price}. It meets my efficiency threshold."
-                return DealStatus.ACCEPTED, seller_price, self._format_professional(msg)
+                return _OUT_ACCEPT_THRESHOLD, seller_price
             if seller_price <= min(walkaway, market_floor_proxy) and seller_price <= budget:
-                msg = f"I accept ₹{seller_price}. This aligns with my market-floor analysis."
-                return DealStatus.ACCEPTED, seller_price, self._format_professional(msg)
+                return _OUT_ACCEPT_MARKET_FLOOR, seller_price
 
-        closing_target = self._closing_target_from_estimate(context)
         if closing_target is not None:
             closing_target = min(closing_target, walkaway, budget)
 
         # Late-round finalization
-        if context.current_round >= 9:
+        if current_round >= 9:
             if seller_price is not None and seller_price <= budget:
-                msg = f"Finalizing at ₹{seller_price}."
-                return DealStatus.ACCEPTED, seller_price, self._format_professional(msg)
+                return _OUT_ACCEPT_FINAL, seller_price
             last_shot = min(budget, walkaway)
             if closing_target:
                 last_shot = min(last_shot, max(interview_threshold, closing_target))
-            # when making last shot, demand reciprocity proportional to buyer concessions
-            buyer_conc_count = len(self._state["concessions"]["buyer"])
-            demand = self._format_reciprocity_request(buyer_conc_count)
-            msg = f"Final offer ₹{last_shot}. In return I require: {demand}. Immediate confirmation concludes the deal."
-            return DealStatus.ONGOING, last_shot, self._format_professional(msg)
+            return _OUT_FINAL_OFFER, last_shot
 
         # Normal-round dynamic target
-        r = max(1, min(10, context.current_round))
+        r = max(1, min(10, current_round))
         progress = (r - 1) / 9.0
         eased = progress ** 0.9
         dynamic_target = int(opening + (walkaway - opening) * eased)
 
         if seller_price is not None and seller_price <= min(dynamic_target, budget):
-            msg = f"Agreed at ₹{seller_price}. Efficient resolution."
-            return DealStatus.ACCEPTED, seller_price, self._format_professional(msg)
+            return _OUT_ACCEPT_TARGET, seller_price
 
         if seller_price is None:
-            proposed = min(budget, max(opening, int(last_my * 1.08)))
-            content = f"My counter is ₹{proposed}. Provide a numeric offer to proceed."
-            return DealStatus.ONGOING, proposed, self._format_professional(content)
+            return _OUT_COUNTER_NO_PRICE, min(budget, max(opening, int(last_my * 1.08)))
 
         # Gap-driven step as original
         gap = max(0, seller_price - last_my)
-        base_far = int(max(self.MIN_STEP, market * 0.06))
-        base_close = int(max(self.MIN_STEP, market * 0.02))
+        base_far, base_close = c.base_far, c.base_close
         pct_gap = gap / max(1, last_my)
 
         if pct_gap > 0.18:
@@ -393,8 +468,8 @@ class YourBuyerAgent(BaseBuyerAgent):
         else:
             step = base_close
 
-        if r > self.FAST_CONCESSION_AFTER:
-            step = int(step * self.FAST_CONCESSION_MULT)
+        if r > cls.FAST_CONCESSION_AFTER:
+            step = int(step * cls.FAST_CONCESSION_MULT)
 
         target_anchor = None
         if closing_target:
@@ -403,40 +478,83 @@ class YourBuyerAgent(BaseBuyerAgent):
 
         if target_anchor:
             toward = max(step, int((target_anchor - last_my) * 0.5))
-            proposed = last_my + max(self.MIN_STEP, toward)
+            proposed = last_my + max(cls.MIN_STEP, toward)
         else:
-            proposed = last_my + max(self.MIN_STEP, int(max(step, gap * 0.45)))
+            proposed = last_my + max(cls.MIN_STEP, int(max(step, gap * 0.45)))
 
         proposed = max(proposed, opening, last_my)
         proposed = min(proposed, budget, walkaway)
+        return _OUT_COUNTER, proposed
+
+    # ---------- Required  ----------
+    def generate_opening_offer(self, context: NegotiationContext) -> Tuple[int, str]:
+        offer = self._pricing_for(context).opening
+        name = context.product.name
+        qty = context.product.quantity
+        # Track initial buyer offer as a 'concession' step 0 (we note but don't demand yet)
+        self._record_concession("buyer", offer)
+        self._last_my_offer = offer
+        return offer, self._professional_message("opening", offer, qty, context.product.quality_grade, name)
 
+    def respond_to_seller_offer(self, context: NegotiationContext, seller_price: int, seller_message: str) -> Tuple[DealStatus, int, str]:
+        # Analyze tone and update estimates
+        observed = seller_price if seller_price is not None else self._extract_price(seller_message)
+        if observed:
+            # detect seller concession relative to last seen
+            seller_conc = self._seller_made_concession(observed) if self._last_seller_price is not None else None
+            self._update_seller_estimates(observed)
+            if seller_conc and seller_conc > 0:
+                self._record_concession("seller", seller_conc)
+
+        tone_adapt = self.personality_adaptation(seller_message)
+
+        pricing = self._pricing_for(context)
+        last_my = self._last_my_offer or pricing.opening
+
+        outcome, price = self._compute_counter(
+            pricing, last_my, seller_price, context.current_round, self._closing_target_from_estimate(context),
+        )
+
+        if outcome == _OUT_ACCEPT_THRESHOLD:
+            return DealStatus.ACCEPTED, price, self._professional_message("accept_threshold", price)
+        if outcome == _OUT_ACCEPT_MARKET_FLOOR:
+            return DealStatus.ACCEPTED, price, self._professional_message("accept_market_floor", price)
+        if outcome == _OUT_ACCEPT_FINAL:
+            return DealStatus.ACCEPTED, price, self._professional_message("accept_final", price)
+        if outcome == _OUT_FINAL_OFFER:
+            # when making last shot, demand reciprocity proportional to buyer concessions
+            demand = self._format_reciprocity_request(len(self._buyer_concessions))
+            self._last_my_offer = price
+            return DealStatus.ONGOING, price, self._professional_message("final_offer", price, demand)
+        if outcome == _OUT_ACCEPT_TARGET:
+            return DealStatus.ACCEPTED, price, self._professional_message("accept_target", price)
+        if outcome == _OUT_COUNTER_NO_PRICE:
+            self._last_my_offer = price
+            return DealStatus.ONGOING, price, self._professional_message("counter_no_price", price)
+
+        proposed = price
         # If we are increasing our offer compared to last time, record buyer concession
         if proposed > last_my:
             self._record_concession("buyer", proposed - last_my)
 
         # Determine reciprocity demand if buyer already conceded more times than seller
-        buyer_conc_count = len(self._state["concessions"]["buyer"])
-        seller_conc_count = len(self._state["concessions"]["seller"])
+        buyer_conc_count = len(self._buyer_concessions)
+        seller_conc_count = len(self._seller_concessions)
         reciprocity_text = ""
         if buyer_conc_count > seller_conc_count:
             demand = self._format_reciprocity_request(buyer_conc_count)
             reciprocity_text = f" In return for this move I need: {demand}."
 
         # Tailor message tone based on adaptation
-        if tone_adapt := tone_adapt if (tone_adapt := tone_adapt) else "logical":
-            if tone_adapt == "logical":
-                content = (
-                    f"My counter is ₹{proposed}. This reflects market structure, my ceiling, and time-to-agreement." + reciprocity_text
-                )
-            else:  # appeal
-                content = (
-                    f"My counter is ₹{proposed}. I prefer to work with you — if you can include {self._format_reciprocity_request(buyer_conc_count)}, we can close today." +
-                    " Let's make this a lasting cooperation."
-                )
-        else:
-            content = f"My counter is ₹{proposed}." + reciprocity_text
+        if tone_adapt == "logical":
+            message = self._professional_message("counter_logical", proposed, reciprocity_text)
+        else:  # appeal
+            message = self._professional_message(
+                "counter_appeal", proposed, self._format_reciprocity_request(buyer_conc_count)
+            )
 
-        return DealStatus.ONGOING, proposed, self._format_professional(content)
+        self._last_my_offer = proposed
+        return DealStatus.ONGOING, proposed, message
 
     # ---------- Optional helpers ----------
     def analyze_negotiation_progress(self, context: NegotiationContext) -> Dict[str, Any]:
@@ -448,13 +566,13 @@ class YourBuyerAgent(BaseBuyerAgent):
     def calculate_fair_price(self, product: Product) -> int:
         market = product.base_market_price
         grade = (product.quality_grade or "").upper()
-        if "EXPORT" in grade:
-            return int(market * 1.02)
-        if grade == "A":
-            return int(market * 0.98)
-        if grade == "B":
-            return int(market * 0.92)
-        return market
+        mult = _GRADE_FAIR_MULT.get(grade)
+        if mult is None:
+            # grades such as "Export A" still count as export
+            if "EXPORT" not in grade:
+                return market
+            mult = _GRADE_FAIR_MULT["EXPORT"]
+        return int(market * mult)
 
     def get_personality_prompt(self) -> str:
         return (
@@ -478,8 +596,19 @@ class YourSellerAgent(BaseBuyerAgent):
     - If opponent is cold/logical, add subtle personal appeal
     - Never go below minimum acceptable floor
     """
-    def __init__(self, name: str = "ProfessionalSeller"):
+    __slots__ = (
+        "_last_buyer_price", "_max_buyer_seen", "_buyer_max_est", "_last_my_offer",
+        "_buyer_concessions", "_seller_concessions", "_last_buyer_tone",
+        "_anchors_market", "_anchors", "_rng_state",
+    )
+
+    def __init__(self, name: str = "ProfessionalSeller", seed: Optional[int] = None):
         super().__init__(name=name)
+        # state lives for the agent's lifetime, created once up front
+        self._init_state()
+        # message-variant PRNG; drawn from `random` unless a fixed seed is given for replays
+        self._rng_state = (random.getrandbits(64) if seed is None else seed) & _LCG_MASK
+
     # ---- Tunable hyperparameters ----
     MIN_STEP = 1000
     AGG_OPEN_RATIO = 1.25        # Seller opening relative to market price
@@ -491,6 +620,21 @@ class YourSellerAgent(BaseBuyerAgent):
     MIN_BUYER_MARGIN = 0.92
     SAVINGS_THRESHOLD = 0.08
 
+    # ---- Message wrappers: every lead x tail pairing, "%s" is the content ----
+    _PROFESSIONAL_TEMPLATES = tuple(
+        f"{lead} %s {tail}"
+        for lead in ("Professionally:", "Let's be clear:", "For efficiency:", "Directly:")
+        for tail in ("Confirm at your earliest.", "I expect reciprocity.", "Proceed accordingly.", "This is sustainable.")
+    )
+    _MESSAGES = _compose_messages(_PROFESSIONAL_TEMPLATES, {
+        "opening": "My opening is ₹%s for %s units of %s-grade %s.",
+        "accept_final": "Finalizing at ₹%s.",
+        "final_offer": "Final offer ₹%s. In return I require: %s. Immediate confirmation secures the deal.",
+        "accept_target": "Agreed at ₹%s. Efficient resolution.",
+        "counter_logical": "My counter is ₹%s. This reflects market floor and sustainable pricing.%s",
+        "counter_appeal": "My counter is ₹%s. I’d prefer to continue this partnership — include %s, and we close today.",
+    })
+
     def define_personality(self) -> Dict[str, Any]:
          return {
             "personality_type": "persuasive",
@@ -512,20 +656,26 @@ class YourSellerAgent(BaseBuyerAgent):
         }
 
     # ---------- State helpers ----------
-    def _init_state(self, context: NegotiationContext):
-        if not hasattr(self, "_state"):
-            self._state = {
-                "buyer_history": [],
-                "max_buyer_seen": None,
-                "buyer_max_est": None,
-                "concessions": {"buyer": [], "seller": []},
-                "last_buyer_tone": "neutral",
-            }
-
-    def _format_professional(self, content: str) -> str:
-        lead = random.choice(["Professionally:", "Let's be clear:", "For efficiency:", "Directly:"])
-        tail = random.choice(["Confirm at your earliest.", "I expect reciprocity.", "Proceed accordingly.", "This is sustainable."])
-        return f"{lead} {content} {tail}"
+    def _init_state(self):
+        self._last_buyer_price: Optional[int] = None
+        self._max_buyer_seen: Optional[int] = None
+        self._buyer_max_est: Optional[int] = None
+        self._last_my_offer: Optional[int] = None
+        self._buyer_concessions: List[int] = []
+        self._seller_concessions: List[int] = []
+        self._last_buyer_tone = "neutral"
+        # (opening, floor, base step) for the market price they were computed from
+        self._anchors_market: Optional[int] = None
+        self._anchors: Tuple[int, int, int] = (0, 0, 0)
+
+    def _pick(self, seq):
+        """Cheap 64-bit LCG choice; only used to vary message wording"""
+        self._rng_state = s = (self._rng_state * _LCG_MULT + _LCG_INC) & _LCG_MASK
+        return seq[(s >> 33) % len(seq)]
+
+    def _professional_message(self, key: str, *args) -> str:
+        """Format message `key` with args inside a randomly chosen professional wrapper"""
+        return self._pick(self._MESSAGES[key]) % args
 
     # ---------- Tone analysis ----------
     def analyze_buyer_tone(self, text: str) -> str:
@@ -550,7 +700,7 @@ class YourSellerAgent(BaseBuyerAgent):
 
     def personality_adaptation(self, buyer_message: str) -> str:
         tone = self.analyze_buyer_tone(buyer_message)
-        self._state["last_buyer_tone"] = tone
+        self._last_buyer_tone = tone
         if tone == "emotional":
             return "logical"
         if tone == "logical":
@@ -559,27 +709,19 @@ class YourSellerAgent(BaseBuyerAgent):
 
     # ---------- Concession tracking ----------
     def _record_concession(self, actor: str, amount: int):
-        self._state["concessions"][actor].append(amount)
+        concessions = self._buyer_concessions if actor == "buyer" else self._seller_concessions
+        concessions.append(amount)
 
     def _buyer_made_concession(self, new_buyer_price: int) -> Optional[int]:
-        hist = self._state["buyer_history"]
-        if not hist:
+        last = self._last_buyer_price
+        if last is None:
             return None
-        last = hist[-1]
         if new_buyer_price > last:
             return new_buyer_price - last
         return None
 
     def _format_reciprocity_request(self, seller_concession_count: int) -> str:
-        demands = [
-            "commitment to higher volume",
-            "faster payment terms",
-            "exclusive supplier status",
-            "priority contract renewal",
-            "multi-order agreement"
-        ]
-        idx = min(len(demands) - 1, seller_concession_count - 1) if seller_concession_count > 0 else 0
-        return demands[idx]
+        return _SELLER_DEMANDS[min(_SELLER_DEMANDS_LAST, max(0, seller_concession_count - 1))]
 
     # ---------- Pricing helpers ----------
     def _opening_offer_number(self, context: NegotiationContext) -> int:
@@ -591,43 +733,48 @@ class YourSellerAgent(BaseBuyerAgent):
         market = context.product.base_market_price
         return int(market * self.WALKAWAY_RATIO)
 
+    def _price_anchors(self, context: NegotiationContext) -> Tuple[int, int, int]:
+        """(opening, floor, base step), recomputed only when the market price changes"""
+        market = context.product.base_market_price
+        if market != self._anchors_market:
+            step = int(max(self.MIN_STEP, market * 0.05))
+            self._anchors = (self._opening_offer_number(context), self._walkaway_floor(context), step)
+            self._anchors_market = market
+        return self._anchors
+
     def _update_buyer_estimates(self, buyer_price: int):
-        st = self._state
-        st["buyer_history"].append(buyer_price)
+        self._last_buyer_price = buyer_price
 
-        if st["max_buyer_seen"] is None:
-            st["max_buyer_seen"] = buyer_price
+        if self._max_buyer_seen is None:
+            self._max_buyer_seen = buyer_price
         else:
-            st["max_buyer_seen"] = max(st["max_buyer_seen"], buyer_price)
+            self._max_buyer_seen = max(self._max_buyer_seen, buyer_price)
 
         rough_cap = int(buyer_price * 1.10)
-        if st["buyer_max_est"] is None:
-            st["buyer_max_est"] = rough_cap
+        if self._buyer_max_est is None:
+            self._buyer_max_est = rough_cap
         else:
-            st["buyer_max_est"] = int(self.EST_DECAY * st["buyer_max_est"] + (1 - self.EST_DECAY) * rough_cap)
+            self._buyer_max_est = int(self.EST_DECAY * self._buyer_max_est + (1 - self.EST_DECAY) * rough_cap)
 
     def _closing_target_from_estimate(self, context: NegotiationContext) -> Optional[int]:
-        st = self._state
-        if not st["max_buyer_seen"]:
+        if not self._max_buyer_seen:
             return None
-        est_cap = int(st["max_buyer_seen"] * 1.02)
+        est_cap = int(self._max_buyer_seen * 1.02)
         return est_cap
 
     # ---------- Required ----------
     def generate_opening_offer(self, context: NegotiationContext) -> Tuple[int, str]:
-        self._init_state(context)
-        offer = self._opening_offer_number(context)
+        offer = self._price_anchors(context)[0]
         name = context.product.name
         qty = context.product.quantity
-        content = f"My opening is ₹{offer} for {qty} units of {context.product.quality_grade}-grade {name}."
         self._record_concession("seller", 0)
-        return offer, self._format_professional(content)
+        self._last_my_offer = offer
+        return offer, self._professional_message("opening", offer, qty, context.product.quality_grade, name)
 
     def respond_to_seller_offer(self, context: NegotiationContext, buyer_price: int, buyer_message: str) -> Tuple[DealStatus, int, str]:
-        self._init_state(context)
 
         if buyer_price:
-            buyer_conc = self._buyer_made_concession(buyer_price) if self._state["buyer_history"] else None
+            buyer_conc = self._buyer_made_concession(buyer_price) if self._last_buyer_price is not None else None
             self._update_buyer_estimates(buyer_price)
             if buyer_conc and buyer_conc > 0:
                 self._record_concession("buyer", buyer_conc)
@@ -635,9 +782,8 @@ class YourSellerAgent(BaseBuyerAgent):
         tone_adapt = self.personality_adaptation(buyer_message)
 
         market = context.product.base_market_price
-        opening = self._opening_offer_number(context)
-        floor = self._walkaway_floor(context)
-        last_my = context.your_offers[-1] if context.your_offers else opening
+        opening, floor, base_step = self._price_anchors(context)
+        last_my = self._last_my_offer or opening
 
         closing_target = self._closing_target_from_estimate(context)
         if closing_target is not None:
@@ -646,14 +792,13 @@ class YourSellerAgent(BaseBuyerAgent):
         # Late-round finalization
         if context.current_round >= 9:
             if buyer_price and buyer_price >= floor:
-                msg = f"Finalizing at ₹{buyer_price}."
-                return DealStatus.ACCEPTED, buyer_price, self._format_professional(msg)
+                return DealStatus.ACCEPTED, buyer_price, self._professional_message("accept_final", buyer_price)
             last_shot = max(floor, market)
             if closing_target:
                 last_shot = max(last_shot, closing_target)
-            demand = self._format_reciprocity_request(len(self._state["concessions"]["seller"]))
-            msg = f"Final offer ₹{last_shot}. In return I require: {demand}. Immediate confirmation secures the deal."
-            return DealStatus.ONGOING, last_shot, self._format_professional(msg)
+            demand = self._format_reciprocity_request(len(self._seller_concessions))
+            self._last_my_offer = last_shot
+            return DealStatus.ONGOING, last_shot, self._professional_message("final_offer", last_shot, demand)
 
         # Dynamic target
         r = max(1, min(10, context.current_round))
@@ -662,12 +807,11 @@ class YourSellerAgent(BaseBuyerAgent):
         dynamic_target = int(opening - (opening - floor) * eased)
 
         if buyer_price and buyer_price >= dynamic_target:
-            msg = f"Agreed at ₹{buyer_price}. Efficient resolution."
-            return DealStatus.ACCEPTED, buyer_price, self._format_professional(msg)
+            return DealStatus.ACCEPTED, buyer_price, self._professional_message("accept_target", buyer_price)
 
         # Calculate counter
         gap = (last_my - buyer_price) if buyer_price else 0
-        step = int(max(self.MIN_STEP, market * 0.05))
+        step = base_step
 
         if r > self.FAST_CONCESSION_AFTER:
             step = int(step * self.FAST_CONCESSION_MULT)
@@ -679,18 +823,21 @@ class YourSellerAgent(BaseBuyerAgent):
             self._record_concession("seller", last_my - proposed)
 
         # Reciprocity check
-        buyer_conc_count = len(self._state["concessions"]["buyer"])
-        seller_conc_count = len(self._state["concessions"]["seller"])
+        buyer_conc_count = len(self._buyer_concessions)
+        seller_conc_count = len(self._seller_concessions)
         reciprocity_text = ""
         if seller_conc_count > buyer_conc_count:
             reciprocity_text = f" In return I require: {self._format_reciprocity_request(seller_conc_count)}."
 
         if tone_adapt == "logical":
-            content = f"My counter is ₹{proposed}. This reflects market floor and sustainable pricing." + reciprocity_text
+            message = self._professional_message("counter_logical", proposed, reciprocity_text)
         else:
-            content = f"My counter is ₹{proposed}. I’d prefer to continue this partnership — include {self._format_reciprocity_request(seller_conc_count)}, and we close today."
+            message = self._professional_message(
+                "counter_appeal", proposed, self._format_reciprocity_request(seller_conc_count)
+            )
 
-        return DealStatus.ONGOING, proposed, self._format_professional(content)
+        self._last_my_offer = proposed
+        return DealStatus.ONGOING, proposed, message
     def get_personality_prompt(self) -> str:
         return (
             "You are a master of persuasion and influence in sales negotiations. You use charm, "
@@ -712,6 +859,12 @@ class ExampleSimpleAgent(BaseBuyerAgent):
     This agent has basic logic - you should do better!
     """
     
+    # Counter replies indexed by "close to agreement" (0 or 1)
+    _COUNTER_MESSAGES = (
+        "I can go up to ₹{}, but that's pushing my budget.",
+        "That's a bit steep for me. How about ₹{}?",
+    )
+    
     def define_personality(self) -> Dict[str, Any]:
         return {
             "personality_type": "cautious",
@@ -732,15 +885,14 @@ class ExampleSimpleAgent(BaseBuyerAgent):
         if seller_price <= context.your_budget and seller_price <= context.product.base_market_price * 0.85:
             return DealStatus.ACCEPTED, seller_price, f"Alright, ₹{seller_price} works for me!"
         
-        # Counter with small increment
+        # Counter with small increment (+10%), integer-only and without a data-dependent branch
+        budget = context.your_budget
         last_offer = context.your_offers[-1] if context.your_offers else 0
-        counter = min(int(last_offer * 1.1), context.your_budget)
-        
-        if counter >= seller_price * 0.95:  # Close to agreement
-            counter = min(seller_price - 1000, context.your_budget)
-            return DealStatus.ONGOING, counter, f"That's a bit steep for me. How about ₹{counter}?"
+        raised = min((last_offer * 11) // 10, budget)
+        close = int(raised * 20 >= seller_price * 19)  # Close to agreement (>= 95% of the ask)
+        counter = raised + close * (min(seller_price - 1000, budget) - raised)
         
-        return DealStatus.ONGOING, counter, f"I can go up to ₹{counter}, but that's pushing my budget."
+        return DealStatus.ONGOING, counter, self._COUNTER_MESSAGES[close].format(counter)
     
     def get_personality_prompt(self) -> str:
         return """
@@ -757,31 +909,61 @@ class ExampleSimpleAgent(BaseBuyerAgent):
 class MockSellerAgent:
     """A simple mock seller for testing your agent"""
     
+    # Reply kinds returned by _compute, indexing _REPLIES
+    DEAL, FINAL_OFFER, COUNTER = 0, 1, 2
+    _REPLIES = (
+        "You have a deal at ₹{}!",
+        "Final offer: ₹{}. Take it or leave it.",
+        "I can come down to ₹{}.",
+    )
+    
+    __slots__ = ("min_price", "personality", "_accept_at")
+    
     def __init__(self, min_price: int, personality: str = "standard"):
-        self.min_price = min_price
         self.personality = personality
+        self.reset(min_price)
+    
+    def reset(self, min_price: int) -> None:
+        """Re-arm this seller for a new negotiation with a different floor"""
+        self.min_price = min_price
+        # Smallest integer offer with offer >= min_price * 1.1, so the per-round check is one int compare
+        self._accept_at = math.ceil(min_price * 1.1)
         
     def get_opening_price(self, product: Product) -> Tuple[int, str]:
         # Start at 150% of market price
-        price = int(product.base_market_price * 1.5)
+        price = (product.base_market_price * 3) // 2
         return price, f"These are premium {product.quality_grade} grade {product.name}. I'm asking ₹{price}."
     
-    def respond_to_buyer(self, buyer_offer: int, round_num: int) -> Tuple[int, str, bool]:
-        if buyer_offer >= self.min_price * 1.1:  # Good profit
-            return buyer_offer, f"You have a deal at ₹{buyer_offer}!", True
+    def _compute(self, buyer_offer: int, round_num: int) -> Tuple[int, int]:
+        """Numeric reply: (price, kind) where kind is DEAL, FINAL_OFFER or COUNTER"""
+        if buyer_offer >= self._accept_at:  # Good profit
+            return buyer_offer, self.DEAL
             
         if round_num >= 8:  # Close to timeout
-            counter = max(self.min_price, int(buyer_offer * 1.05))
-            return counter, f"Final offer: ₹{counter}. Take it or leave it.", False
-        else:
-            counter = max(self.min_price, int(buyer_offer * 1.15))
-            return counter, f"I can come down to ₹{counter}.", False
+            return max(self.min_price, int(buyer_offer * 1.05)), self.FINAL_OFFER
+        return max(self.min_price, int(buyer_offer * 1.15)), self.COUNTER
+    
+    def _message(self, kind: int, price: int) -> str:
+        return self._REPLIES[kind].format(price)
+    
+    def respond_to_buyer(self, buyer_offer: int, round_num: int) -> Tuple[int, str, bool]:
+        price, kind = self._compute(buyer_offer, round_num)
+        return price, self._message(kind, price), kind == self.DEAL
 
 
-def run_negotiation_test(buyer_agent: BaseBuyerAgent, product: Product, buyer_budget: int, seller_min: int) -> Dict[str, Any]:
-    """Test a negotiation between your buyer and a mock seller"""
+def run_negotiation_test(buyer_agent: BaseBuyerAgent, product: Product, buyer_budget: int, seller_min: int,
+                         log_messages: bool = True, seller: Optional[MockSellerAgent] = None) -> Dict[str, Any]:
+    """
+    Test a negotiation between your buyer and a mock seller.
+    With log_messages=False (numeric sweeps) nothing is logged and "conversation" is empty;
+    the agents still exchange their messages as usual.
+    A caller running many negotiations may pass one seller to reuse; it is reset to seller_min here.
+    """
     
-    seller = MockSellerAgent(seller_min)
+    if seller is None:
+        seller = MockSellerAgent(seller_min)
+    else:
+        seller.reset(seller_min)
     context = NegotiationContext(
         product=product,
         your_budget=buyer_budget,
@@ -794,26 +976,37 @@ def run_negotiation_test(buyer_agent: BaseBuyerAgent, product: Product, buyer_bu
     # Seller opens
     seller_price, seller_msg = seller.get_opening_price(product)
     context.seller_offers.append(seller_price)
-    context.messages.append({"role": "seller", "message": seller_msg})
+    if log_messages:
+        context.messages.append({"role": "seller", "message": seller_msg})
     
     # Run negotiation
     deal_made = False
     final_price = None
     
-    for round_num in range(10):  # Max 10 rounds
+    # Round 1, outside the loop: the buyer's opening offer (never an acceptance) and the seller's reply
+    context.current_round = 1
+    buyer_offer, buyer_msg = buyer_agent.generate_opening_offer(context)
+    context.your_offers.append(buyer_offer)
+    if log_messages:
+        context.messages.append({"role": "buyer", "message": buyer_msg})
+    seller_price, seller_msg, seller_accepts = seller.respond_to_buyer(buyer_offer, 0)
+    if log_messages:
+        context.messages.append({"role": "seller", "message": seller_msg})
+    
+    for round_num in range(1, 10):  # Rounds 2..10 (max 10 rounds)
+        if seller_accepts:
+            break
+        context.seller_offers.append(seller_price)
         context.current_round = round_num + 1
         
         # Buyer responds
-        if round_num == 0:
-            buyer_offer, buyer_msg = buyer_agent.generate_opening_offer(context)
-            status = DealStatus.ONGOING
-        else:
-            status, buyer_offer, buyer_msg = buyer_agent.respond_to_seller_offer(
-                context, seller_price, seller_msg
-            )
+        status, buyer_offer, buyer_msg = buyer_agent.respond_to_seller_offer(
+            context, seller_price, seller_msg
+        )
         
         context.your_offers.append(buyer_offer)
-        context.messages.append({"role": "buyer", "message": buyer_msg})
+        if log_messages:
+            context.messages.append({"role": "buyer", "message": buyer_msg})
         
         if status == DealStatus.ACCEPTED:
             deal_made = True
@@ -822,15 +1015,12 @@ def run_negotiation_test(buyer_agent: BaseBuyerAgent, product: Product, buyer_bu
             
         # Seller responds
         seller_price, seller_msg, seller_accepts = seller.respond_to_buyer(buyer_offer, round_num)
-        
-        if seller_accepts:
-            deal_made = True
-            final_price = buyer_offer
+        if log_messages:
             context.messages.append({"role": "seller", "message": seller_msg})
-            break
-            
-        context.seller_offers.append(seller_price)
-        context.messages.append({"role": "seller", "message": seller_msg})
+    
+    if seller_accepts:
+        deal_made = True
+        final_price = buyer_offer
     
     # Calculate results
     result = {
@@ -846,10 +1036,96 @@ def run_negotiation_test(buyer_agent: BaseBuyerAgent, product: Product, buyer_bu
     return result
 
 
+def simulate_example_negotiation(market_price: int, buyer_budget: int, seller_min: int) -> Tuple[bool, Optional[int], int]:
+    """
+    Numbers-only replay of run_negotiation_test for ExampleSimpleAgent vs MockSellerAgent.
+
+    Both agents' pricing rules are inlined as plain int/float arithmetic with no messages,
+    contexts or dicts, so large parameter sweeps avoid the per-round object and string work.
+    Returns (deal_made, final_price, rounds) exactly as run_negotiation_test would report them.
+    """
+    seller_price = (market_price * 3) // 2      # MockSellerAgent.get_opening_price
+    accept_at = math.ceil(seller_min * 1.1)     # MockSellerAgent._accept_at
+    buyer_offer = min(int(market_price * 0.6), buyer_budget)  # ExampleSimpleAgent opening
+
+    for round_num in range(10):
+        if round_num:
+            # ExampleSimpleAgent.respond_to_seller_offer
+            if seller_price <= buyer_budget and seller_price <= market_price * 0.85:
+                return True, seller_price, round_num + 1
+            raised = min((buyer_offer * 11) // 10, buyer_budget)
+            close = int(raised * 20 >= seller_price * 19)
+            buyer_offer = raised + close * (min(seller_price - 1000, buyer_budget) - raised)
+
+        # MockSellerAgent.respond_to_buyer
+        if buyer_offer >= accept_at:
+            return True, buyer_offer, round_num + 1
+        if round_num >= 8:
+            seller_price = max(seller_min, int(buyer_offer * 1.05))
+        else:
+            seller_price = max(seller_min, int(buyer_offer * 1.15))
+
+    return False, None, 10
+
+
+def simulate_batch(budgets: List[int], seller_mins: List[int], market_prices: List[int],
+                   workers: int = 1) -> Tuple[List[bool], List[Optional[int]], List[int]]:
+    """
+    Run simulate_example_negotiation for each (budget, seller_min, market_price) triple.
+
+    Returns parallel lists (deals, final_prices, rounds). Cases are independent, so with
+    workers > 1 they are split across that many processes and the results are identical.
+    """
+    if workers > 1:
+        chunksize = max(1, len(budgets) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(simulate_example_negotiation, market_prices, budgets, seller_mins,
+                                    chunksize=chunksize))
+    else:
+        results = list(map(simulate_example_negotiation, market_prices, budgets, seller_mins))
+    deals = [r[0] for r in results]
+    final_prices = [r[1] for r in results]
+    rounds = [r[2] for r in results]
+    return deals, final_prices, rounds
+
+
 # ============================================
 # PART 6: TEST YOUR AGENT
 # ============================================
 
+# Test scenarios: (name, buyer budget factor, seller floor factor), both applied to market price
+BUYER_TEST_SCENARIOS = (
+    ("easy",   1.2, 0.8),
+    ("medium", 1.0, 0.85),
+    ("hard",   0.9, 0.82),
+)
+SELLER_TEST_SCENARIOS = (
+    ("easy",          1.2,  0.8),   # Buyer has plenty of money
+    ("medium",        1.0,  0.85),  # Buyer at market price
+    ("hard",          0.9,  0.82),  # Buyer below market
+    ("very_hard",     0.85, 0.90),  # Buyer very tight, seller above market
+    ("budget_tight",  0.8,  0.75),  # Buyer extremely low, seller floor lower
+    ("seller_strong", 1.05, 0.95),  # Buyer has some room, seller barely negotiates
+)
+
+
+def _scenario_cases(products: List[Product], scenarios: Tuple[Tuple[str, float, float], ...]
+                    ) -> List[Tuple[Product, str, int, int, str, str, str]]:
+    """
+    Expand products x scenarios up front: (product, scenario, buyer_budget, seller_min,
+    budget_str, market_str, seller_str), with the ₹ amounts already comma-formatted.
+    """
+    cases = []
+    for product in products:
+        market = product.base_market_price
+        market_str = f"{market:,}"
+        for scenario, budget_factor, seller_factor in scenarios:
+            buyer_budget = int(market * budget_factor)
+            seller_min = int(market * seller_factor)
+            cases.append((product, scenario, buyer_budget, seller_min,
+                          f"{buyer_budget:,}", market_str, f"{seller_min:,}"))
+    return cases
+
 def test_buyer_agent():
     """Run this to test your agent implementation"""
     
@@ -885,33 +1161,24 @@ def test_buyer_agent():
     
     total_savings = 0
     deals_made = 0
+    mock_seller = MockSellerAgent(0)  # reset to each scenario's floor by run_negotiation_test
     
     # Run multiple test scenarios
-    for product in test_products:
-        for scenario in ["easy", "medium", "hard"]:
-            if scenario == "easy":
-                buyer_budget = int(product.base_market_price * 1.2)
-                seller_min = int(product.base_market_price * 0.8)
-            elif scenario == "medium":
-                buyer_budget = int(product.base_market_price * 1.0)
-                seller_min = int(product.base_market_price * 0.85)
-            else:  # hard
-                buyer_budget = int(product.base_market_price * 0.9)
-                seller_min = int(product.base_market_price * 0.82)
-            
-            print(f"\nTest: {product.name} - {scenario} scenario")
-            print(f"Your Budget: ₹{buyer_budget:,} | Market Price: ₹{product.base_market_price:,}")
-            
-            result = run_negotiation_test(your_agent, product, buyer_budget, seller_min)
-            
-            if result["deal_made"]:
-                deals_made += 1
-                total_savings += result["savings"]
-                print(f"✅ DEAL at ₹{result['final_price']:,} in {result['rounds']} rounds")
-                print(f"   Savings: ₹{result['savings']:,} ({result['savings_pct']:.1f}%)")
-                print(f"   Below Market: {result['below_market_pct']:.1f}%")
-            else:
-                print(f"❌ NO DEAL after {result['rounds']} rounds")
+    for product, scenario, buyer_budget, seller_min, budget_str, market_str, _ in _scenario_cases(
+            test_products, BUYER_TEST_SCENARIOS):
+        print(f"\nTest: {product.name} - {scenario} scenario")
+        print(f"Your Budget: ₹{budget_str} | Market Price: ₹{market_str}")
+        
+        result = run_negotiation_test(your_agent, product, buyer_budget, seller_min, seller=mock_seller)
+        
+        if result["deal_made"]:
+            deals_made += 1
+            total_savings += result["savings"]
+            print(f"✅ DEAL at ₹{result['final_price']:,} in {result['rounds']} rounds")
+            print(f"   Savings: ₹{result['savings']:,} ({result['savings_pct']:.1f}%)")
+            print(f"   Below Market: {result['below_market_pct']:.1f}%")
+        else:
+            print(f"❌ NO DEAL after {result['rounds']} rounds")
     
     # Summary
     print("\n" + "="*60)
@@ -956,45 +1223,26 @@ def test_seller_agent():
 
     total_profit = 0
     deals_made = 0
+    mock_seller = MockSellerAgent(0)  # reset to each scenario's floor by run_negotiation_test
 
     # Run multiple test scenarios
-    for product in test_products:
-        for scenario in ["easy", "medium", "hard", "very_hard", "budget_tight", "seller_strong"]:
-            if scenario == "easy":
-                buyer_budget = int(product.base_market_price * 1.2)   # Buyer has plenty of money
-                seller_min   = int(product.base_market_price * 0.8)
-            elif scenario == "medium":
-                buyer_budget = int(product.base_market_price * 1.0)   # Buyer at market price
-                seller_min   = int(product.base_market_price * 0.85)
-            elif scenario == "hard":
-                buyer_budget = int(product.base_market_price * 0.9)   # Buyer below market
-                seller_min   = int(product.base_market_price * 0.82)
-            elif scenario == "very_hard":
-                buyer_budget = int(product.base_market_price * 0.85)  # Buyer very tight
-                seller_min   = int(product.base_market_price * 0.90)  # Seller above market
-            elif scenario == "budget_tight":
-                buyer_budget = int(product.base_market_price * 0.8)   # Buyer extremely low
-                seller_min   = int(product.base_market_price * 0.75)  # Seller floor lower
-            elif scenario == "seller_strong":
-                buyer_budget = int(product.base_market_price * 1.05)  # Buyer has some room
-                seller_min   = int(product.base_market_price * 0.95)  # Seller barely negotiates
-
-
-            print(f"\nTest: {product.name} - {scenario} scenario")
-            print(f"Buyer Budget: ₹{buyer_budget:,} | Market Price: ₹{product.base_market_price:,} | Seller Floor: ₹{seller_min:,}")
-
-            result = run_negotiation_test(seller_agent, product, buyer_budget, seller_min)
-
-            if result["deal_made"]:
-                deals_made += 1
-                profit = result["final_price"] - product.base_market_price
-                total_profit += profit
-                above_market_pct = (profit / product.base_market_price * 100) if product.base_market_price > 0 else 0
-
-                print(f"✅ DEAL at ₹{result['final_price']:,} in {result['rounds']} rounds")
-                print(f"   Profit vs Market: ₹{profit:,} ({above_market_pct:.1f}% above market)")
-            else:
-                print(f"❌ NO DEAL after {result['rounds']} rounds")
+    for product, scenario, buyer_budget, seller_min, budget_str, market_str, seller_str in _scenario_cases(
+            test_products, SELLER_TEST_SCENARIOS):
+        print(f"\nTest: {product.name} - {scenario} scenario")
+        print(f"Buyer Budget: ₹{budget_str} | Market Price: ₹{market_str} | Seller Floor: ₹{seller_str}")
+
+        result = run_negotiation_test(seller_agent, product, buyer_budget, seller_min, seller=mock_seller)
+
+        if result["deal_made"]:
+            deals_made += 1
+            profit = result["final_price"] - product.base_market_price
+            total_profit += profit
+            above_market_pct = (profit / product.base_market_price * 100) if product.base_market_price > 0 else 0
+
+            print(f"✅ DEAL at ₹{result['final_price']:,} in {result['rounds']} rounds")
+            print(f"   Profit vs Market: ₹{profit:,} ({above_market_pct:.1f}% above market)")
+        else:
+            print(f"❌ NO DEAL after {result['rounds']} rounds")
 
 
     # Summary
@@ -1005,6 +1253,34 @@ def test_seller_agent():
     print(f"Success Rate: {deals_made/6*100:.1f}%")
     print("=" * 60)
 
+def test_simulation_matches_harness():
+    """Check simulate_example_negotiation and simulate_batch against run_negotiation_test on a fixed grid"""
+    example_agent = ExampleSimpleAgent("SimCheck")
+    markets, budgets, seller_mins, expected = [], [], [], []
+    for market in (37, 999, 150000, 180000, 250001):
+        product = Product(name="Sample", category="Mangoes", quantity=1, quality_grade="A",
+                          origin="Test", base_market_price=market, attributes={})
+        for budget_factor in (0.3, 0.6, 0.85, 1.0, 1.2, 1.6):
+            for seller_factor in (0.3, 0.75, 0.8, 0.9, 1.1, 1.3):
+                buyer_budget = int(market * budget_factor)
+                seller_min = int(market * seller_factor)
+                result = run_negotiation_test(example_agent, product, buyer_budget, seller_min)
+                expected.append((result["deal_made"], result["final_price"], result["rounds"]))
+                markets.append(market)
+                budgets.append(buyer_budget)
+                seller_mins.append(seller_min)
+    
+    for market, buyer_budget, seller_min, want in zip(markets, budgets, seller_mins, expected):
+        got = simulate_example_negotiation(market, buyer_budget, seller_min)
+        assert got == want, f"simulate_example_negotiation{(market, buyer_budget, seller_min)} = {got}, harness gave {want}"
+    
+    want_lists = tuple(list(column) for column in zip(*expected))
+    for workers in (1, 2):
+        got_lists = simulate_batch(budgets, seller_mins, markets, workers=workers)
+        assert got_lists == want_lists, f"simulate_batch(workers={workers}) disagrees with run_negotiation_test"
+    
+    print(f"\nSimulation check: {len(expected)} cases match run_negotiation_test")
+
 
 
 
@@ -1065,3 +1341,4 @@ FILENAME: negotiation_agent_[your_name].py
 if __name__ == "__main__":
     test_buyer_agent()
     test_seller_agent()
+    test_simulation_matches_harness()